@@ -0,0 +1,68 @@
+import asyncpg
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from src.core.settings import settings
+
+SQLALCHEMY_DATABASE_URL = make_url(settings.DATABASE_URL).set(
+    drivername="postgresql+asyncpg"
+)
+
+# Statement logging is opt-in; for ad-hoc debugging prefer raising the
+# "sqlalchemy.engine" logger level over flipping DB_ECHO.
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={
+        "prepared_statement_cache_size": settings.PG_STATEMENT_CACHE_SIZE,
+    },
+)
+
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+class _Base:
+    # Fetch server-generated values (e.g. onupdate=func.now()) with RETURNING
+    # after UPDATE as well as INSERT, so they're never left expired and
+    # lazy-loaded under an AsyncSession (MissingGreenlet). Models declaring
+    # their own __mapper_args__ must merge this in: {**Base.__mapper_args__}.
+    __mapper_args__ = {"eager_defaults": True}
+
+    def __repr__(self) -> str:
+        # Read the loaded state directly so repr() never triggers a lazy load,
+        # which would fail outside the greenlet on an async session.
+        return f"<{type(self).__name__}(id={self.__dict__.get('id')})>"
+
+
+Base = declarative_base(cls=_Base)
+
+
+_DIALECT_ONLY_CONNECT_ARGS = (
+    "async_fallback",
+    "prepared_statement_cache_size",
+    "prepared_statement_name_func",
+)
+
+
+async def create_pg_pool() -> asyncpg.Pool:
+    # Raw asyncpg pool for hot read paths that don't need the ORM. Connect
+    # with the same arguments as the engine (including DSN query options
+    # such as ssl), minus the ones only SQLAlchemy's dialect understands.
+    _, connect_kwargs = engine.dialect.create_connect_args(
+        SQLALCHEMY_DATABASE_URL,
+    )
+    for key in _DIALECT_ONLY_CONNECT_ARGS:
+        connect_kwargs.pop(key, None)
+    return await asyncpg.create_pool(
+        **connect_kwargs,
+        min_size=settings.PG_POOL_MIN_SIZE,
+        max_size=settings.PG_POOL_MAX_SIZE,
+        statement_cache_size=settings.PG_STATEMENT_CACHE_SIZE,
+    )
@@ -0,0 +1,27 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from src.core.database import create_pg_pool, engine
+from src.core.settings import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The raw pool is opt-in so workers don't hold idle connections (or fail
+    # to start while the DB is down) when no endpoint uses get_pg_connection.
+    app.state.pg_pool = None
+    if settings.PG_POOL_ENABLED:
+        app.state.pg_pool = await create_pg_pool()
+    try:
+        yield
+    finally:
+        if app.state.pg_pool is not None:
+            await app.state.pg_pool.close()
+        await engine.dispose()
+
+
+# orjson only replaces the final dumps(); FastAPI has already encoded
+# datetime/UUID values to JSON primitives before the response class runs.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
@@ -0,0 +1,31 @@
+from typing import AsyncIterator
+
+import asyncpg
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import AsyncSessionLocal
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    # No commit here: read-only requests shouldn't pay for a COMMIT round-trip,
+    # writers commit (or use session.begin()) themselves.
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_db_transaction() -> AsyncIterator[AsyncSession]:
+    # One transaction per request for mutating endpoints: queries flush() as
+    # needed and the single COMMIT happens here (or ROLLBACK on error).
+    async with AsyncSessionLocal() as session, session.begin():
+        yield session
+
+
+async def get_pg_connection(
+    request: Request,
+) -> AsyncIterator[asyncpg.Connection]:
+    pg_pool = request.app.state.pg_pool
+    if pg_pool is None:
+        raise RuntimeError("get_pg_connection requires PG_POOL_ENABLED=true")
+    async with pg_pool.acquire() as connection:
+        yield connection
@@ -0,0 +1,16 @@
+import uvicorn
+
+from src.core.settings import settings
+
+# uvloop and httptools come from the uvicorn[standard] extra; uvicorn's
+# default loop/http selection uses them wherever they are installed and
+# falls back to asyncio/h11 elsewhere (e.g. uvloop on Windows).
+if __name__ == "__main__":
+    uvicorn.run(
+        "src.core.routers:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=settings.RELOAD,
+        # The reloader only supports a single process.
+        workers=1 if settings.RELOAD else settings.WORKERS,
+    )
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, func, text
+from sqlalchemy.dialects.postgresql import UUID
+
+
+class UUIDPrimaryKeyMixin:
+    # gen_random_uuid() is built in from PostgreSQL 13 (pgcrypto before that).
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+
+class TimestampMixin:
+    # Timestamps come from the database clock. A Python-side
+    # default=datetime.now(...) is evaluated once at import and would stamp
+    # every row with the process start time. Keeping "modified" loaded after
+    # UPDATE relies on Base's eager_defaults mapper arg.
+    created = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    modified = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from src.core import settings as settings_module
+from src.core.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in list(Settings.model_fields):
+        monkeypatch.delenv(name, raising=False)
+
+
+def make_settings(cpus=1, **overrides):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(settings_module.os, "cpu_count", lambda: cpus)
+        return Settings(_env_file=None, **overrides)
+
+
+def total_connections(s):
+    workers = 1 if s.RELOAD else s.WORKERS
+    raw = s.PG_POOL_MAX_SIZE if s.PG_POOL_ENABLED else 0
+    return workers * (s.DB_POOL_SIZE + s.DB_MAX_OVERFLOW + raw)
+
+
+def test_single_worker_gets_whole_budget():
+    s = make_settings(cpus=1)
+    assert s.WORKERS == 1
+    assert (s.DB_POOL_SIZE, s.DB_MAX_OVERFLOW) == (40, 40)
+    assert s.PG_POOL_MAX_SIZE == 0
+
+
+def test_budget_split_across_cpus():
+    s = make_settings(cpus=8)
+    assert s.WORKERS == 8
+    assert (s.DB_POOL_SIZE, s.DB_MAX_OVERFLOW) == (5, 5)
+
+
+def test_raw_pool_takes_a_quarter_and_clamps_min_size():
+    s = make_settings(cpus=8, PG_POOL_ENABLED=True)
+    assert s.PG_POOL_MAX_SIZE == 2
+    assert s.PG_POOL_MIN_SIZE == 2
+    assert (s.DB_POOL_SIZE, s.DB_MAX_OVERFLOW) == (4, 4)
+
+
+@pytest.mark.parametrize("pg_pool_enabled", [False, True])
+def test_many_cpus_caps_default_workers(caplog, pg_pool_enabled):
+    with caplog.at_level(logging.WARNING, logger=settings_module.__name__):
+        s = make_settings(cpus=128, PG_POOL_ENABLED=pg_pool_enabled)
+    assert s.WORKERS < 128
+    assert s.DB_POOL_SIZE + s.DB_MAX_OVERFLOW >= (
+        settings_module.MIN_ENGINE_CONNECTIONS_PER_WORKER
+    )
+    assert total_connections(s) <= s.DB_MAX_CONNECTIONS
+    assert "instead of one per CPU (128)" in caplog.text
+
+
+def test_reload_uses_a_single_worker_budget():
+    s = make_settings(cpus=16, RELOAD=True)
+    assert (s.DB_POOL_SIZE, s.DB_MAX_OVERFLOW) == (40, 40)
+
+
+def test_explicit_pool_sizes_are_kept():
+    s = make_settings(
+        WORKERS=4,
+        DB_POOL_SIZE=3,
+        PG_POOL_ENABLED=True,
+        PG_POOL_MAX_SIZE=5,
+    )
+    assert (s.DB_POOL_SIZE, s.DB_MAX_OVERFLOW) == (3, 12)
+    assert s.PG_POOL_MAX_SIZE == 5
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8, 40])
+@pytest.mark.parametrize("pg_pool_enabled", [False, True])
+def test_totals_fit_the_budget(workers, pg_pool_enabled):
+    s = make_settings(WORKERS=workers, PG_POOL_ENABLED=pg_pool_enabled)
+    assert s.DB_POOL_SIZE >= 1
+    assert total_connections(s) <= s.DB_MAX_CONNECTIONS
+
+
+def test_explicit_workers_over_budget_raises():
+    with pytest.raises(ValidationError, match="too small for 128 workers"):
+        make_settings(WORKERS=128)
+
+
+@pytest.mark.parametrize("field", ["WORKERS", "DB_MAX_CONNECTIONS"])
+def test_non_positive_values_are_rejected(field):
+    with pytest.raises(ValidationError):
+        make_settings(**{field: 0})